@@ -0,0 +1,191 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Red Hat, Inc.
+# SPDX-License-Identifier: MIT
+#
+"""Export drift between the kernel_settings profile and the live kernel
+
+Parse the tuned profile written by the kernel_settings role, read the
+matching /proc/sys and /sys values, and write the result as a Prometheus
+node_exporter textfile collector file.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import argparse
+import glob
+import os
+import re
+import sys
+import tempfile
+import time
+
+PROC_SYS = "/proc/sys"
+THP_DIR = "/sys/kernel/mm/transparent_hugepage"
+
+# [vm] section options of the tuned profile and the files they control
+VM_FILES = {
+    "transparent_hugepages": THP_DIR + "/enabled",
+    "transparent_hugepage.defrag": THP_DIR + "/defrag",
+}
+
+SECTION_RE = re.compile(r"^\[(?P<name>[^\]]+)\]$")
+# sysfs files like THP enabled report "always [madvise] never"
+SELECTED_RE = re.compile(r"\[([^\]]*)\]")
+
+
+def parse_profile(path):
+    """Return dict of section name to dict of option name to value."""
+    sections = {}
+    current = None
+    with open(path) as profile:
+        for line in profile:
+            line = line.strip()
+            if not line or line.startswith("#") or line.startswith(";"):
+                continue
+            match = SECTION_RE.match(line)
+            if match:
+                current = sections.setdefault(match.group("name"), {})
+                continue
+            if current is None or "=" not in line:
+                continue
+            key, val = line.split("=", 1)
+            current[key.strip()] = val.strip()
+    return sections
+
+
+def sysctl_path(name, proc_sys=PROC_SYS):
+    """Convert a sysctl name to its path under /proc/sys.
+
+    Follow the sysctl(8) convention - if the first separator is a dot,
+    dots separate the components and slashes stand for literal dots.
+    """
+    name = name.strip("./")
+    if re.match(r"^[^./]*\.", name):
+        name = name.replace(".", "\0").replace("/", ".").replace("\0", "/")
+    return os.path.join(proc_sys, name)
+
+
+def normalize(value):
+    """Return value with whitespace collapsed and the selected item extracted."""
+    selected = SELECTED_RE.search(value)
+    if selected:
+        value = selected.group(1)
+    return " ".join(value.split())
+
+
+def read_value(path):
+    """Return the stripped content of path, or None if it cannot be read."""
+    try:
+        with open(path) as sysfile:
+            return sysfile.read().strip()
+    except (IOError, OSError):
+        return None
+
+
+def managed_files(sections, proc_sys=PROC_SYS):
+    """Yield (section, key, wanted value, list of files) for each setting."""
+    for key, val in sorted(sections.get("sysctl", {}).items()):
+        yield "sysctl", key, val, [sysctl_path(key, proc_sys)]
+    for key, val in sorted(sections.get("sysfs", {}).items()):
+        # tuned allows shell style wildcards in sysfs names
+        yield "sysfs", key, val, sorted(glob.glob(key)) or [key]
+    for key, val in sorted(sections.get("vm", {}).items()):
+        if key in VM_FILES:
+            yield "vm", key, val, [VM_FILES[key]]
+
+
+def compute_drift(sections, proc_sys=PROC_SYS):
+    """Return list of (section, key, drift) and the number of unreadable keys.
+
+    drift is 1 if any file backing the setting differs from the profile
+    value, 0 otherwise.  Settings using tuned variable expansion cannot
+    be compared and are skipped.
+    """
+    results = []
+    unreadable = 0
+    for section, key, val, paths in managed_files(sections, proc_sys):
+        if "${" in val:
+            continue
+        live = [read_value(path) for path in paths]
+        if None in live:
+            unreadable += 1
+            continue
+        wanted = normalize(val)
+        drift = int(any(normalize(item) != wanted for item in live))
+        results.append((section, key, drift))
+    return results, unreadable
+
+
+def escape_label(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_metrics(results, unreadable, timestamp):
+    """Format the drift results in the Prometheus text exposition format."""
+    lines = [
+        "# HELP kernel_settings_drift Whether the live value differs "
+        "from the kernel_settings profile.",
+        "# TYPE kernel_settings_drift gauge",
+    ]
+    for section, key, drift in results:
+        lines.append(
+            'kernel_settings_drift{section="%s",key="%s"} %d'
+            % (escape_label(section), escape_label(key), drift)
+        )
+    lines.extend(
+        [
+            "# HELP kernel_settings_drift_count Number of settings whose "
+            "live value differs from the kernel_settings profile.",
+            "# TYPE kernel_settings_drift_count gauge",
+            "kernel_settings_drift_count %d" % sum(drift for _, _, drift in results),
+            "# HELP kernel_settings_drift_unreadable_count Number of "
+            "settings whose live value could not be read.",
+            "# TYPE kernel_settings_drift_unreadable_count gauge",
+            "kernel_settings_drift_unreadable_count %d" % unreadable,
+            "# HELP kernel_settings_drift_last_run_timestamp_seconds "
+            "Time of the last drift check.",
+            "# TYPE kernel_settings_drift_last_run_timestamp_seconds gauge",
+            "kernel_settings_drift_last_run_timestamp_seconds %d" % timestamp,
+        ]
+    )
+    return "\n".join(lines) + "\n"
+
+
+def write_atomic(path, content):
+    """Write content to path so that node_exporter never sees a partial file."""
+    dir_name = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=dir_name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as tmp_fd:
+            tmp_fd.write(content)
+        os.chmod(tmp_path, 0o644)
+        os.rename(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            # already removed or never created
+            pass
+        raise
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profile", required=True, help="tuned profile to check")
+    parser.add_argument("--output", required=True, help="textfile to write")
+    args = parser.parse_args(argv)
+
+    try:
+        sections = parse_profile(args.profile)
+    except (IOError, OSError):
+        # no profile yet - nothing is managed, so nothing can drift
+        sections = {}
+    results, unreadable = compute_drift(sections)
+    write_atomic(args.output, format_metrics(results, unreadable, time.time()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,380 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Red Hat, Inc.
+# SPDX-License-Identifier: MIT
+#
+"""Compute the changes the kernel_settings role would make"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+ANSIBLE_METADATA = {
+    "metadata_version": "1.1",
+    "status": ["preview"],
+    "supported_by": "community",
+}
+
+DOCUMENTATION = """
+---
+module: kernel_settings_dry_run
+
+short_description: Compute the changes to the kernel settings without making them
+
+version_added: "1.6.0"
+
+description:
+    - "WARNING: Do not use this module directly! It is only for role internal use."
+    - Merge the given settings with the current kernel_settings profile in the
+      same way as the role does, and compare the result with both the
+      profile and the live C(/proc/sys) and C(/sys) values.
+    - Nothing is written.  The module reports changed if the profile would
+      change, or if a live value differs from the new profile value.
+    - The python configobj module is used to parse the profile if it is
+      installed.  Otherwise a simple parser is used, so that the dry run
+      works before the role has installed anything.
+
+options:
+    path:
+        description:
+            - Path of the profile file.  If relative, it is relative to the
+              first existing directory in I(profile_dirs).
+        required: true
+        type: str
+    profile_dirs:
+        description:
+            - Candidate parent directories of the profile, in order.
+        required: false
+        type: list
+        elements: path
+        default: []
+    tuned_main_conf:
+        description:
+            - Path of the tuned main config.  If it sets C(profile_dirs), the
+              last directory in it is tried before I(profile_dirs).
+        required: false
+        type: path
+    sysctl:
+        description: The kernel_settings_sysctl value
+        required: false
+        type: raw
+        default: []
+    sysfs:
+        description: The kernel_settings_sysfs value
+        required: false
+        type: raw
+        default: []
+    systemd_cpu_affinity:
+        description: The kernel_settings_systemd_cpu_affinity value
+        required: false
+        type: raw
+    transparent_hugepages:
+        description: The kernel_settings_transparent_hugepages value
+        required: false
+        type: raw
+    transparent_hugepages_defrag:
+        description: The kernel_settings_transparent_hugepages_defrag value
+        required: false
+        type: raw
+    tuned_include:
+        description: The kernel_settings_tuned_include value
+        required: false
+        type: raw
+    purge:
+        description: The kernel_settings_purge value
+        required: false
+        type: bool
+        default: false
+
+author:
+    - Linux System Roles (@linux-system-roles)
+"""
+
+EXAMPLES = """
+- name: Show what would change
+  kernel_settings_dry_run:
+    path: kernel_settings/tuned.conf
+    profile_dirs:
+      - /etc/tuned/profiles
+      - /etc/tuned
+    tuned_main_conf: /etc/tuned/tuned-main.conf
+    sysctl:
+      - name: vm.swappiness
+        value: 10
+    transparent_hugepages: madvise
+"""
+
+RETURN = """
+path:
+  description: The profile file which was compared
+  returned: always
+  type: str
+changes:
+  description:
+    - list of the settings which would change in the profile, or whose live
+      value differs from the new profile value
+  returned: always
+  type: list
+  elements: dict
+  contains:
+    section:
+      description: profile section - sysctl, sysfs, systemd, vm, or main
+      type: str
+    key:
+      description: setting name, in the canonical form
+      type: str
+    old:
+      description: value in the current profile, null if not set
+      type: str
+    new:
+      description: value in the new profile, null if removed
+      type: str
+    live:
+      description:
+        - live value, null if it cannot be read or is not a kernel setting
+      type: str
+    file_change:
+      description: true if the profile would change
+      type: bool
+    live_change:
+      description: true if applying the new profile would change the live value
+      type: bool
+"""
+
+import glob
+import os
+import re
+
+try:
+    import configobj
+
+    HAS_CONFIGOBJ = True
+except ImportError:
+    HAS_CONFIGOBJ = False
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.kernel_settings_lsr.normalize import (
+    KEY_NORMALIZERS,
+    PROC_SYS,
+    normalize_data,
+    normalize_value,
+    sysctl_name_to_path,
+)
+
+THP_DIR = "/sys/kernel/mm/transparent_hugepage"
+STATE_ABSENT = {"state": "absent"}
+STATE_EMPTY = {"state": "empty"}
+PREVIOUS_REPLACED = {"previous": "replaced"}
+
+# the scalar settings - (section, key, live file)
+SCALAR_SETTINGS = {
+    "systemd_cpu_affinity": ("systemd", "cpu_affinity", None),
+    "transparent_hugepages": ("vm", "transparent_hugepages", THP_DIR + "/enabled"),
+    "transparent_hugepages_defrag": (
+        "vm",
+        "transparent_hugepage.defrag",
+        THP_DIR + "/defrag",
+    ),
+    "tuned_include": ("main", "include", None),
+}
+
+# sysfs files like THP enabled report "always [madvise] never"
+SELECTED_RE = re.compile(r"\[([^\]]*)\]")
+
+
+def find_profile(path, profile_dirs, tuned_main_conf=None):
+    """Return the profile path the role would use."""
+    if os.path.isabs(path):
+        return path
+    dirs = list(profile_dirs)
+    if tuned_main_conf:
+        conf_dirs = read_profile(tuned_main_conf).get("profile_dirs", "")
+        if conf_dirs:
+            dirs.insert(0, conf_dirs.split(",")[-1])
+    for parent in dirs:
+        if parent and os.path.isdir(parent):
+            return os.path.join(parent, path)
+    return os.path.join(dirs[-1], path) if dirs else path
+
+
+def _parse_value(value):
+    """Return the value like configobj does for the simple values tuned uses."""
+    value = value.strip()
+    if value[:1] in "\"'" and value[-1:] == value[:1]:
+        return value
+    # unquoted values end at a comment, and commas separate list items
+    value = value.split("#", 1)[0].strip()
+    if "," in value:
+        return [item.strip() for item in value.split(",") if item.strip()]
+    return value
+
+
+def parse_ini(path):
+    """Return the data of the ini file at path without configobj.
+
+    A dry run must work on hosts where the role has never run, so
+    configobj may not be installed yet.
+    """
+    data = {}
+    current = data
+    with open(path) as ini_file:
+        for line in ini_file:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("[") and line.endswith("]"):
+                current = data.setdefault(line[1:-1].strip(), {})
+                continue
+            if "=" not in line:
+                continue
+            key, value = line.split("=", 1)
+            current[key.strip()] = _parse_value(value)
+    return data
+
+
+def read_profile(path):
+    """Return the normalized profile data, empty if there is no profile."""
+    try:
+        if HAS_CONFIGOBJ:
+            data = configobj.ConfigObj(path).dict()
+        else:
+            data = parse_ini(path)
+    except IOError:
+        return {}
+    return normalize_data(data)
+
+
+def merge_list(current, settings, section, purge):
+    """Return the new dict of a list type section like the role does."""
+    if purge or settings == STATE_EMPTY or PREVIOUS_REPLACED in settings:
+        new = {}
+    else:
+        new = dict(current)
+    if settings == STATE_EMPTY:
+        return new
+    for item in settings:
+        if "previous" in item:
+            continue
+        name = KEY_NORMALIZERS[section](item["name"])
+        if item.get("state", "present") == "absent" or "value" not in item:
+            new.pop(name, None)
+        else:
+            new[name] = normalize_value(item["value"])
+    return new
+
+
+def merge_scalar(current, value, purge):
+    """Return the new value of a scalar setting like the role does."""
+    if value is not None and value != STATE_ABSENT:
+        # the role also accepts values which are not strings, e.g. an int
+        new = normalize_value(value)
+        if new:
+            return new
+    if purge or value == STATE_ABSENT:
+        return None
+    return current
+
+
+def read_live(paths):
+    """Return the normalized live value, None if it cannot be read."""
+    values = []
+    for path in paths:
+        try:
+            with open(path) as sysfile:
+                value = sysfile.read()
+        except (IOError, OSError):
+            return None
+        selected = SELECTED_RE.search(value)
+        if selected:
+            value = selected.group(1)
+        values.append(" ".join(value.split()))
+    if not values or len(set(values)) > 1:
+        # differing values of a sysfs wildcard are shown all at once
+        return ", ".join(values) if values else None
+    return values[0]
+
+
+def _live_paths(section, key, live_file, proc_sys):
+    if section == "sysctl":
+        return [sysctl_name_to_path(key, proc_sys)]
+    if section == "sysfs":
+        # tuned allows shell style wildcards in sysfs names
+        return sorted(glob.glob(key)) or [key]
+    if live_file:
+        return [live_file]
+    return []
+
+
+def _change(section, key, old, new, live_file=None, proc_sys=PROC_SYS):
+    paths = _live_paths(section, key, live_file, proc_sys)
+    live = read_live(paths) if paths else None
+    # removed settings are not reset, and tuned variables cannot be compared
+    live_change = bool(
+        paths and new is not None and "${" not in new and live is not None
+    ) and (normalize_value(new) != live)
+    return dict(
+        section=section,
+        key=key,
+        old=old,
+        new=new,
+        live=live,
+        file_change=old != new,
+        live_change=live_change,
+    )
+
+
+def dry_run(current, params, proc_sys=PROC_SYS):
+    """Return the list of changes of the given role parameters."""
+    purge = params.get("purge", False)
+    changes = []
+    for section in ("sysctl", "sysfs"):
+        old = current.get(section, {})
+        new = merge_list(old, params.get(section) or [], section, purge)
+        for key in sorted(set(old) | set(new)):
+            changes.append(
+                _change(section, key, old.get(key), new.get(key), None, proc_sys)
+            )
+    for param in sorted(SCALAR_SETTINGS):
+        section, key, live_file = SCALAR_SETTINGS[param]
+        old = current.get(section, {}).get(key)
+        new = merge_scalar(old, params.get(param), purge)
+        if old is not None or new is not None:
+            changes.append(_change(section, key, old, new, live_file, proc_sys))
+    return [item for item in changes if item["file_change"] or item["live_change"]]
+
+
+def run_module():
+    """The entry point of the module."""
+
+    module_args = dict(
+        path=dict(type="str", required=True),
+        profile_dirs=dict(type="list", elements="path", default=[]),
+        tuned_main_conf=dict(type="path"),
+        sysctl=dict(type="raw", default=[]),
+        sysfs=dict(type="raw", default=[]),
+        systemd_cpu_affinity=dict(type="raw"),
+        transparent_hugepages=dict(type="raw"),
+        transparent_hugepages_defrag=dict(type="raw"),
+        tuned_include=dict(type="raw"),
+        purge=dict(type="bool", default=False),
+    )
+
+    module = AnsibleModule(argument_spec=module_args, supports_check_mode=True)
+
+    path = find_profile(
+        module.params["path"],
+        module.params["profile_dirs"],
+        module.params["tuned_main_conf"],
+    )
+    changes = dry_run(read_profile(path), module.params)
+    module.exit_json(changed=len(changes) > 0, path=path, changes=changes)
+
+
+def main():
+    """The main function!"""
+    run_module()
+
+
+if __name__ == "__main__":
+    main()
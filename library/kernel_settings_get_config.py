@@ -35,6 +35,19 @@ options:
         description: Path to parse
         required: true
         type: str
+    normalize:
+        description:
+            - Return the data in canonical form, so that semantically equal
+              settings compare equal.
+            - Runs of whitespace in values are replaced by a single space,
+              and surrounding quotes are removed.
+            - Names in the sysctl section use dots as separators, as in
+              C(sysctl -a) output.
+            - Paths in the sysfs section have duplicate and trailing slashes
+              removed.
+        required: false
+        type: bool
+        default: false
 
 author:
     - Rich Megginson (@richm)
@@ -62,6 +75,7 @@ except ImportError:
     HAS_CONFIGOBJ = False
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.kernel_settings_lsr.normalize import normalize_data
 
 
 def run_module():
@@ -69,6 +83,7 @@ def run_module():
 
     module_args = dict(
         path=dict(type="str", required=True),
+        normalize=dict(type="bool", default=False),
     )
 
     result = dict(changed=False)
@@ -78,6 +93,8 @@ def run_module():
     try:
         cobj = configobj.ConfigObj(module.params["path"])
         data = cobj.dict()
+        if module.params["normalize"]:
+            data = normalize_data(data)
         result["data"] = data
     except IOError:
         result["data"] = {}
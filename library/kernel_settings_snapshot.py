@@ -0,0 +1,231 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Red Hat, Inc.
+# SPDX-License-Identifier: MIT
+#
+"""Gather a snapshot of the live kernel settings"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+ANSIBLE_METADATA = {
+    "metadata_version": "1.1",
+    "status": ["preview"],
+    "supported_by": "community",
+}
+
+DOCUMENTATION = """
+---
+module: kernel_settings_snapshot
+
+short_description: Gather the live values of all readable kernel settings
+
+version_added: "1.6.0"
+
+description:
+    - "WARNING: Do not use this module directly! It is only for role internal use."
+    - Walk the given directories, usually C(/proc/sys) and some C(/sys)
+      subtrees, and read every readable file using a pool of threads.
+    - Write-only files and files which are known to block or to have side
+      effects when read are skipped.
+    - Files under C(/proc/sys) are reported by their sysctl name, all other
+      files are reported by their path.
+
+options:
+    paths:
+        description: Directories to walk
+        required: false
+        type: list
+        elements: path
+        default: ["/proc/sys"]
+    prefixes:
+        description:
+            - Only report settings whose sysctl name or path starts with one
+              of these prefixes.  Report everything if empty.
+        required: false
+        type: list
+        elements: str
+        default: []
+    exclude:
+        description: Shell style patterns of file paths to skip
+        required: false
+        type: list
+        elements: str
+        default: []
+    workers:
+        description: Number of threads used to read the files
+        required: false
+        type: int
+        default: 8
+    return_values:
+        description:
+            - If false, only return the hash and the count of the settings,
+              not the values.
+        required: false
+        type: bool
+        default: true
+
+author:
+    - Linux System Roles (@linux-system-roles)
+"""
+
+EXAMPLES = """
+- name: Snapshot sysctl and transparent hugepage settings
+  kernel_settings_snapshot:
+    paths:
+      - /proc/sys
+      - /sys/kernel/mm/transparent_hugepage
+    prefixes:
+      - net.
+      - vm.
+      - /sys/kernel/mm
+"""
+
+RETURN = """
+ansible_facts:
+  description: Facts to add to ansible_facts
+  returned: always
+  type: complex
+  contains:
+    kernel_settings_snapshot_result:
+      description: The snapshot of the live kernel settings
+      returned: always
+      type: complex
+      contains:
+        values:
+          description:
+            - dict of sysctl name or sysfs path to value, with runs of
+              whitespace in the value replaced by a single space
+          returned: when return_values is true
+          type: dict
+        count:
+          description: number of settings in the snapshot
+          returned: always
+          type: int
+        hash:
+          description:
+            - sha256 hex digest of the snapshot, to quickly find hosts
+              which have identical settings
+          returned: always
+          type: str
+"""
+
+import fnmatch
+import hashlib
+import os
+import stat
+from multiprocessing.pool import ThreadPool
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.kernel_settings_lsr.normalize import (
+    PROC_SYS,
+    path_to_sysctl_name,
+)
+
+# reading these blocks until there is data, or has side effects
+BLOCKING_FILES = ("trace_pipe", "trace_pipe_raw", "wakeup_count", "stat_refresh")
+# sysctl and sysfs values are short - do not read huge binary attributes
+MAX_VALUE_SIZE = 4096
+
+
+def _is_readable_file(path, name, exclude):
+    if name in BLOCKING_FILES:
+        return False
+    if any(fnmatch.fnmatch(path, pattern) for pattern in exclude):
+        return False
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    # skip symlinks, device nodes, and write-only files such as drop_caches
+    return stat.S_ISREG(st.st_mode) and bool(st.st_mode & 0o444)
+
+
+def _list_files(paths, prefixes, exclude, proc_sys=PROC_SYS):
+    """Return list of (key, path) for each file to read."""
+    files = []
+    for top in paths:
+        for dirpath, dummy, filenames in os.walk(top):
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                key = path_to_sysctl_name(path, proc_sys)
+                if prefixes and not key.startswith(tuple(prefixes)):
+                    continue
+                if _is_readable_file(path, name, exclude):
+                    files.append((key, path))
+    return files
+
+
+def _read_value(key_path):
+    """Return (key, value) - value is None if the file cannot be read."""
+    key, path = key_path
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+    except OSError:
+        return key, None
+    try:
+        data = os.read(fd, MAX_VALUE_SIZE)
+    except (IOError, OSError):
+        # EAGAIN - no data without blocking, others such as ENOENT, ENODATA,
+        # EIO, EBUSY - attributes which exist but have no readable value
+        return key, None
+    finally:
+        os.close(fd)
+    return key, " ".join(data.decode("utf-8", "replace").split())
+
+
+def _snapshot_hash(values):
+    digest = hashlib.sha256()
+    for key in sorted(values):
+        digest.update(("%s=%s\n" % (key, values[key])).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def snapshot(paths, prefixes=None, exclude=None, workers=8, proc_sys=PROC_SYS):
+    """Return dict of key to value for all readable settings under paths."""
+    files = _list_files(paths, prefixes or [], exclude or [], proc_sys)
+    pool = ThreadPool(max(1, workers))
+    try:
+        results = pool.map(_read_value, files, chunksize=64)
+    finally:
+        pool.close()
+        pool.join()
+    return dict((key, val) for key, val in results if val is not None)
+
+
+def run_module():
+    """The entry point of the module."""
+
+    module_args = dict(
+        paths=dict(type="list", elements="path", default=[PROC_SYS]),
+        prefixes=dict(type="list", elements="str", default=[]),
+        exclude=dict(type="list", elements="str", default=[]),
+        workers=dict(type="int", default=8),
+        return_values=dict(type="bool", default=True),
+    )
+
+    module = AnsibleModule(argument_spec=module_args, supports_check_mode=True)
+
+    values = snapshot(
+        module.params["paths"],
+        module.params["prefixes"],
+        module.params["exclude"],
+        module.params["workers"],
+    )
+    facts = dict(count=len(values), hash=_snapshot_hash(values))
+    if module.params["return_values"]:
+        facts["values"] = values
+    module.exit_json(
+        changed=False, ansible_facts=dict(kernel_settings_snapshot_result=facts)
+    )
+
+
+def main():
+    """The main function!"""
+    run_module()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Red Hat, Inc.
+# SPDX-License-Identifier: MIT
+"""Canonical forms of kernel settings names and values
+
+Every module which compares settings uses these, so that semantically
+equal settings compare equal everywhere.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+import re
+
+PROC_SYS = "/proc/sys"
+
+
+def normalize_value(value):
+    """Return value as a string with whitespace collapsed and quotes removed."""
+    if isinstance(value, list):
+        # configobj splits unquoted values containing commas
+        value = ",".join(value)
+    value = " ".join(("%s" % value).split())
+    if len(value) > 1 and value[0] == value[-1] and value[0] in "\"'":
+        value = value[1:-1]
+    return value
+
+
+def normalize_sysctl_name(name):
+    """Return the sysctl name with dots as separators.
+
+    Follow the sysctl(8) convention - if the first separator is a slash,
+    slashes separate the components and dots are literal dots, which are
+    written as slashes in the dotted form.
+    """
+    name = name.strip()
+    if name.startswith(PROC_SYS + "/"):
+        name = name[len(PROC_SYS) + 1 :]
+    name = name.strip("./")
+    if re.match(r"^[^./]*/", name):
+        name = name.replace(".", "\0").replace("/", ".").replace("\0", "/")
+    return name
+
+
+def normalize_sysfs_path(path):
+    """Return path with duplicate and trailing slashes removed."""
+    path = re.sub(r"/+", "/", path.strip())
+    if len(path) > 1:
+        path = path.rstrip("/")
+    return path
+
+
+def sysctl_name_to_path(name, proc_sys=PROC_SYS):
+    """Return the path under proc_sys of a normalized sysctl name."""
+    return os.path.join(
+        proc_sys, name.replace("/", "\0").replace(".", "/").replace("\0", ".")
+    )
+
+
+def path_to_sysctl_name(path, proc_sys=PROC_SYS):
+    """Return the sysctl name for files in proc_sys, else the path."""
+    if not path.startswith(proc_sys + os.sep):
+        return path
+    rel = path[len(proc_sys) + 1 :]
+    return rel.replace(".", "\0").replace(os.sep, ".").replace("\0", "/")
+
+
+KEY_NORMALIZERS = {
+    "sysctl": normalize_sysctl_name,
+    "sysfs": normalize_sysfs_path,
+}
+
+
+def normalize_data(data):
+    """Return a copy of the parsed profile data in canonical form."""
+    result = {}
+    for section, settings in data.items():
+        if not isinstance(settings, dict):
+            result[section] = normalize_value(settings)
+            continue
+        normalize_key = KEY_NORMALIZERS.get(section, lambda key: key)
+        result[section] = dict(
+            (normalize_key(key), normalize_value(val)) for key, val in settings.items()
+        )
+    return result
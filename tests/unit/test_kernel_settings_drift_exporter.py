@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Red Hat, Inc.
+# SPDX-License-Identifier: MIT
+"""Unit tests for the kernel_settings drift exporter script."""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+import re
+import shutil
+import sys
+import tempfile
+import unittest
+
+from ansible.module_utils.kernel_settings_lsr.normalize import (
+    normalize_sysctl_name,
+    sysctl_name_to_path,
+)
+
+# the script is installed on the managed node, not imported by a module
+sys.path.insert(
+    0,
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "files"),
+)
+
+import kernel_settings_drift_exporter  # noqa: E402
+
+
+def _write(path, content):
+    parent = os.path.dirname(path)
+    if not os.path.isdir(parent):
+        os.makedirs(parent)
+    with open(path, "w") as fd:
+        fd.write(content)
+
+
+class TestKernelSettingsDriftExporter(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.proc_sys = os.path.join(self.tmpdir, "proc", "sys")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_parse_profile(self):
+        profile = os.path.join(self.tmpdir, "tuned.conf")
+        _write(
+            profile,
+            "# comment\nignored = before any section\n[main]\n"
+            "summary = kernel settings\n; comment\n[sysctl]\n"
+            "kernel.threads-max = 29968\nnot a setting\n"
+            "net.ipv4.tcp_rmem = 4096 87380 6291456\n",
+        )
+        self.assertEqual(
+            kernel_settings_drift_exporter.parse_profile(profile),
+            {
+                "main": {"summary": "kernel settings"},
+                "sysctl": {
+                    "kernel.threads-max": "29968",
+                    "net.ipv4.tcp_rmem": "4096 87380 6291456",
+                },
+            },
+        )
+
+    def test_sysctl_path(self):
+        sysctl_path = kernel_settings_drift_exporter.sysctl_path
+        self.assertEqual(
+            sysctl_path("kernel.threads-max", "/p"), "/p/kernel/threads-max"
+        )
+        self.assertEqual(
+            sysctl_path("net.ipv4.conf.eth0/1.rp_filter", "/p"),
+            "/p/net/ipv4/conf/eth0.1/rp_filter",
+        )
+        self.assertEqual(
+            sysctl_path("net/ipv4/conf/eth0.1/rp_filter", "/p"),
+            "/p/net/ipv4/conf/eth0.1/rp_filter",
+        )
+        # the script cannot import module_utils, so check that it agrees
+        for name in (
+            "kernel.threads-max",
+            "kernel/threads-max",
+            "net.ipv4.conf.eth0/1.rp_filter",
+            "net/ipv4/conf/eth0.1/rp_filter",
+            ".vm.swappiness.",
+            "fs",
+        ):
+            self.assertEqual(
+                sysctl_path(name, "/p"),
+                sysctl_name_to_path(normalize_sysctl_name(name), "/p"),
+            )
+
+    def test_normalize(self):
+        normalize = kernel_settings_drift_exporter.normalize
+        self.assertEqual(normalize("always [madvise] never\n"), "madvise")
+        self.assertEqual(normalize("4096\t87380   6291456\n"), "4096 87380 6291456")
+        self.assertEqual(normalize("29968"), "29968")
+
+    def test_compute_drift(self):
+        _write(os.path.join(self.proc_sys, "kernel", "threads-max"), "29968\n")
+        _write(os.path.join(self.proc_sys, "vm", "swappiness"), "60\n")
+        _write(
+            os.path.join(self.proc_sys, "net", "ipv4", "tcp_rmem"),
+            "4096\t87380\t6291456\n",
+        )
+        sysfs = os.path.join(self.tmpdir, "sys", "queue")
+        _write(os.path.join(sysfs, "sda", "scheduler"), "none [mq-deadline]\n")
+        _write(os.path.join(sysfs, "sdb", "scheduler"), "[none] mq-deadline\n")
+        sections = {
+            "sysctl": {
+                "kernel.threads-max": "29968",
+                "vm.swappiness": "10",
+                "net.ipv4.tcp_rmem": "4096 87380 6291456",
+                "kernel.no-such-setting": "1",
+                "vm.dirty_ratio": "${f:some_function}",
+            },
+            "sysfs": {os.path.join(sysfs, "*", "scheduler"): "mq-deadline"},
+            "main": {"summary": "not a kernel setting"},
+        }
+        results, unreadable = kernel_settings_drift_exporter.compute_drift(
+            sections, self.proc_sys
+        )
+        self.assertEqual(
+            sorted(results),
+            [
+                ("sysctl", "kernel.threads-max", 0),
+                ("sysctl", "net.ipv4.tcp_rmem", 0),
+                ("sysctl", "vm.swappiness", 1),
+                ("sysfs", os.path.join(sysfs, "*", "scheduler"), 1),
+            ],
+        )
+        self.assertEqual(unreadable, 1)
+
+    def test_format_metrics(self):
+        text = kernel_settings_drift_exporter.format_metrics(
+            [("sysctl", "kernel.threads-max", 0), ("sysfs", '/sys/a"b', 1)],
+            2,
+            1700000000.5,
+        )
+        lines = text.splitlines()
+        self.assertTrue(text.endswith("\n"))
+        self.assertIn(
+            'kernel_settings_drift{section="sysctl",key="kernel.threads-max"} 0',
+            lines,
+        )
+        self.assertIn(
+            'kernel_settings_drift{section="sysfs",key="/sys/a\\"b"} 1', lines
+        )
+        self.assertIn("kernel_settings_drift_count 1", lines)
+        self.assertIn("kernel_settings_drift_unreadable_count 2", lines)
+        self.assertIn(
+            "kernel_settings_drift_last_run_timestamp_seconds 1700000000", lines
+        )
+        for line in lines:
+            if not line.startswith("#"):
+                continue
+            self.assertTrue(re.match(r"^# (HELP|TYPE) kernel_settings_drift\w* ", line))
+
+
+if __name__ == "__main__":
+    unittest.main()
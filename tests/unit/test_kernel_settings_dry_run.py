@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Red Hat, Inc.
+# SPDX-License-Identifier: MIT
+"""Unit tests for kernel_settings_dry_run module helpers."""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+import shutil
+import tempfile
+import unittest
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+import kernel_settings_dry_run
+
+
+def _write(path, content):
+    parent = os.path.dirname(path)
+    if not os.path.isdir(parent):
+        os.makedirs(parent)
+    with open(path, "w") as fd:
+        fd.write(content)
+
+
+class TestKernelSettingsDryRun(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.proc_sys = os.path.join(self.tmpdir, "proc", "sys")
+        _write(os.path.join(self.proc_sys, "vm", "swappiness"), "60\n")
+        _write(os.path.join(self.proc_sys, "kernel", "threads-max"), "29968\n")
+        _write(
+            os.path.join(self.proc_sys, "net", "ipv4", "conf", "eth0.1", "rp_filter"),
+            "1\n",
+        )
+        self.profile = os.path.join(self.tmpdir, "profiles", "ks", "tuned.conf")
+        _write(
+            self.profile,
+            "[main]\nsummary = kernel settings\n"
+            "[sysctl]\nkernel/threads-max = 29968\nvm.swappiness = 30\n",
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _dry_run(self, **params):
+        current = kernel_settings_dry_run.read_profile(self.profile)
+        changes = kernel_settings_dry_run.dry_run(current, params, self.proc_sys)
+        return dict(((item["section"], item["key"]), item) for item in changes)
+
+    def test_read_profile_normalizes(self):
+        data = kernel_settings_dry_run.read_profile(self.profile)
+        self.assertEqual(
+            data["sysctl"], {"kernel.threads-max": "29968", "vm.swappiness": "30"}
+        )
+        missing = os.path.join(self.tmpdir, "missing.conf")
+        self.assertEqual(kernel_settings_dry_run.read_profile(missing), {})
+
+    def test_read_profile_without_configobj(self):
+        _write(
+            self.profile,
+            "# comment\n[main]\nsummary = kernel settings\n"
+            "[sysctl]\nkernel/threads-max = 29968  # inline\n"
+            'net.ipv4.tcp_rmem = "4096  87380 6291456"\n'
+            "[systemd]\ncpu_affinity = 1, 3\n",
+        )
+        expected = kernel_settings_dry_run.read_profile(self.profile)
+        with mock.patch.object(kernel_settings_dry_run, "HAS_CONFIGOBJ", False):
+            self.assertEqual(
+                kernel_settings_dry_run.read_profile(self.profile), expected
+            )
+            missing = os.path.join(self.tmpdir, "missing.conf")
+            self.assertEqual(kernel_settings_dry_run.read_profile(missing), {})
+        self.assertEqual(expected["sysctl"]["net.ipv4.tcp_rmem"], "4096 87380 6291456")
+        self.assertEqual(expected["systemd"]["cpu_affinity"], "1,3")
+
+    def test_no_change(self):
+        changes = self._dry_run(sysctl=[{"name": "kernel.threads-max", "value": 29968}])
+        # vm.swappiness is in the profile but not live
+        self.assertEqual(list(changes), [("sysctl", "vm.swappiness")])
+        item = changes[("sysctl", "vm.swappiness")]
+        self.assertFalse(item["file_change"])
+        self.assertTrue(item["live_change"])
+        self.assertEqual(item["live"], "60")
+
+    def test_file_and_live_change(self):
+        changes = self._dry_run(
+            sysctl=[
+                {"name": "net/ipv4/conf/eth0.1/rp_filter", "value": "2"},
+                {"name": "vm.swappiness", "state": "absent"},
+            ]
+        )
+        item = changes[("sysctl", "net.ipv4.conf.eth0/1.rp_filter")]
+        self.assertEqual((item["old"], item["new"], item["live"]), (None, "2", "1"))
+        self.assertTrue(item["file_change"])
+        self.assertTrue(item["live_change"])
+        # removing a setting does not reset the live value
+        item = changes[("sysctl", "vm.swappiness")]
+        self.assertEqual((item["old"], item["new"]), ("30", None))
+        self.assertTrue(item["file_change"])
+        self.assertFalse(item["live_change"])
+
+    def test_replaced_and_purge(self):
+        changes = self._dry_run(
+            sysctl=[{"previous": "replaced"}, {"name": "vm.swappiness", "value": 60}]
+        )
+        self.assertEqual(changes[("sysctl", "kernel.threads-max")]["new"], None)
+        self.assertFalse(changes[("sysctl", "vm.swappiness")]["live_change"])
+        changes = self._dry_run(purge=True)
+        self.assertEqual(
+            sorted(changes),
+            [("sysctl", "kernel.threads-max"), ("sysctl", "vm.swappiness")],
+        )
+        changes = self._dry_run(sysctl={"state": "empty"})
+        self.assertEqual(len(changes), 2)
+
+    def test_scalar_settings(self):
+        changes = self._dry_run(tuned_include="throughput-performance")
+        item = changes[("main", "include")]
+        self.assertEqual(item["new"], "throughput-performance")
+        self.assertIsNone(item["live"])
+        self.assertFalse(item["live_change"])
+        merge = kernel_settings_dry_run.merge_scalar
+        self.assertEqual(merge("madvise", None, False), "madvise")
+        self.assertEqual(merge("madvise", "never", False), "never")
+        self.assertIsNone(merge("madvise", {"state": "absent"}, False))
+        self.assertIsNone(merge("madvise", None, True))
+        self.assertEqual(merge("0,1", 1, False), "1")
+        self.assertEqual(merge("madvise", " ", False), "madvise")
+        changes = self._dry_run(systemd_cpu_affinity=1)
+        self.assertEqual(changes[("systemd", "cpu_affinity")]["new"], "1")
+
+    def test_find_profile(self):
+        parent = os.path.join(self.tmpdir, "profiles")
+        missing = os.path.join(self.tmpdir, "missing")
+        self.assertEqual(
+            kernel_settings_dry_run.find_profile("ks/tuned.conf", [missing, parent]),
+            self.profile,
+        )
+        conf = os.path.join(self.tmpdir, "tuned-main.conf")
+        _write(conf, "profile_dirs = /usr/lib/tuned,%s\n" % parent)
+        self.assertEqual(
+            kernel_settings_dry_run.find_profile("ks/tuned.conf", [missing], conf),
+            self.profile,
+        )
+        self.assertEqual(
+            kernel_settings_dry_run.find_profile("/etc/ks.conf", [parent]),
+            "/etc/ks.conf",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Red Hat, Inc.
+# SPDX-License-Identifier: MIT
+"""Unit tests for the kernel_settings_lsr normalize module_utils."""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import unittest
+
+from ansible.module_utils.kernel_settings_lsr import normalize
+
+
+class TestKernelSettingsNormalize(unittest.TestCase):
+    def test_normalize_value(self):
+        normalize_value = normalize.normalize_value
+        self.assertEqual(
+            normalize_value("4096\t87380   6291456 "), "4096 87380 6291456"
+        )
+        self.assertEqual(normalize_value('"0"'), "0")
+        self.assertEqual(normalize_value("'madvise'"), "madvise")
+        self.assertEqual(normalize_value(0), "0")
+        self.assertEqual(normalize_value(["1", "3", "5"]), "1,3,5")
+        self.assertEqual(normalize_value('"'), '"')
+        # only one pair of matching quotes is removed, the same as the role
+        # does with __kernel_settings_normalized_value
+        self.assertEqual(normalize_value("\"'x'\""), "'x'")
+        self.assertEqual(normalize_value("\"x'"), "\"x'")
+
+    def test_normalize_sysctl_name(self):
+        normalize_name = normalize.normalize_sysctl_name
+        self.assertEqual(normalize_name("vm.swappiness"), "vm.swappiness")
+        self.assertEqual(normalize_name("vm/swappiness"), "vm.swappiness")
+        self.assertEqual(normalize_name("/proc/sys/vm/swappiness"), "vm.swappiness")
+        self.assertEqual(
+            normalize_name("net/ipv4/conf/eth0.1/rp_filter"),
+            "net.ipv4.conf.eth0/1.rp_filter",
+        )
+        self.assertEqual(
+            normalize_name("net.ipv4.conf.eth0/1.rp_filter"),
+            "net.ipv4.conf.eth0/1.rp_filter",
+        )
+
+    def test_normalize_sysfs_path(self):
+        normalize_path = normalize.normalize_sysfs_path
+        self.assertEqual(
+            normalize_path("/sys/kernel/mm/ksm/run/"), "/sys/kernel/mm/ksm/run"
+        )
+        self.assertEqual(
+            normalize_path("/sys//kernel/mm/ksm/run"), "/sys/kernel/mm/ksm/run"
+        )
+        self.assertEqual(normalize_path("/"), "/")
+
+    def test_sysctl_name_and_path(self):
+        for name, path in (
+            ("vm.swappiness", "/proc/sys/vm/swappiness"),
+            (
+                "net.ipv4.conf.eth0/1.rp_filter",
+                "/proc/sys/net/ipv4/conf/eth0.1/rp_filter",
+            ),
+        ):
+            self.assertEqual(normalize.sysctl_name_to_path(name), path)
+            self.assertEqual(normalize.path_to_sysctl_name(path), name)
+        self.assertEqual(
+            normalize.path_to_sysctl_name("/sys/kernel/mm/enabled"),
+            "/sys/kernel/mm/enabled",
+        )
+
+    def test_normalize_data(self):
+        data = {
+            "main": {"summary": "kernel settings"},
+            "sysctl": {"vm/swappiness": '"10"', "net.ipv4.tcp_rmem": "4096\t87380"},
+            "sysfs": {"/sys/kernel/mm/ksm/run/": "1"},
+            "systemd": {"cpu_affinity": ["1", "3"]},
+        }
+        self.assertEqual(
+            normalize.normalize_data(data),
+            {
+                "main": {"summary": "kernel settings"},
+                "sysctl": {"vm.swappiness": "10", "net.ipv4.tcp_rmem": "4096 87380"},
+                "sysfs": {"/sys/kernel/mm/ksm/run": "1"},
+                "systemd": {"cpu_affinity": "1,3"},
+            },
+        )
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2026, Red Hat, Inc.
+# SPDX-License-Identifier: MIT
+"""Unit tests for kernel_settings_snapshot module helpers."""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import errno
+import os
+import shutil
+import tempfile
+import unittest
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+import kernel_settings_snapshot
+
+
+def _write(path, content, mode=0o644):
+    parent = os.path.dirname(path)
+    if not os.path.isdir(parent):
+        os.makedirs(parent)
+    with open(path, "w") as fd:
+        fd.write(content)
+    os.chmod(path, mode)
+
+
+class TestKernelSettingsSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.proc_sys = os.path.join(self.tmpdir, "proc", "sys")
+        self.sysfs = os.path.join(self.tmpdir, "sys")
+        _write(os.path.join(self.proc_sys, "vm", "swappiness"), "60\n")
+        _write(os.path.join(self.proc_sys, "vm", "drop_caches"), "", 0o200)
+        _write(
+            os.path.join(self.proc_sys, "net", "ipv4", "tcp_rmem"),
+            "4096\t131072\t6291456\n",
+        )
+        _write(
+            os.path.join(self.proc_sys, "net", "ipv4", "conf", "eth0.1", "rp_filter"),
+            "1\n",
+        )
+        _write(os.path.join(self.sysfs, "mm", "enabled"), "always [madvise] never\n")
+        _write(os.path.join(self.sysfs, "tracing", "trace_pipe"), "")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _snapshot(self, **kwargs):
+        return kernel_settings_snapshot.snapshot(
+            [self.proc_sys, self.sysfs], proc_sys=self.proc_sys, **kwargs
+        )
+
+    def test_snapshot(self):
+        values = self._snapshot()
+        self.assertEqual(
+            values,
+            {
+                "vm.swappiness": "60",
+                "net.ipv4.tcp_rmem": "4096 131072 6291456",
+                "net.ipv4.conf.eth0/1.rp_filter": "1",
+                os.path.join(self.sysfs, "mm", "enabled"): "always [madvise] never",
+            },
+        )
+
+    def test_snapshot_prefixes_and_exclude(self):
+        values = self._snapshot(prefixes=["net."], exclude=["*/rp_filter"])
+        self.assertEqual(values, {"net.ipv4.tcp_rmem": "4096 131072 6291456"})
+
+    def test_read_value_error(self):
+        # e.g. xps_cpus and traffic_class under /sys/class/net/*/queues
+        path = os.path.join(self.sysfs, "mm", "enabled")
+        for err in (errno.ENOENT, errno.ENODATA, errno.EBUSY, errno.ETIMEDOUT):
+            with mock.patch("os.read", side_effect=OSError(err, os.strerror(err))):
+                self.assertEqual(
+                    kernel_settings_snapshot._read_value(("key", path)),
+                    ("key", None),
+                )
+
+    def test_snapshot_skips_unreadable(self):
+        real_read = os.read
+
+        def fake_read(fd, size):
+            if os.path.basename(os.readlink("/proc/self/fd/%d" % fd)) == "enabled":
+                raise OSError(errno.ENOENT, os.strerror(errno.ENOENT))
+            return real_read(fd, size)
+
+        with mock.patch("os.read", side_effect=fake_read):
+            values = self._snapshot()
+        self.assertNotIn(os.path.join(self.sysfs, "mm", "enabled"), values)
+        self.assertEqual(values["vm.swappiness"], "60")
+
+    def test_snapshot_hash(self):
+        values = self._snapshot()
+        digest = kernel_settings_snapshot._snapshot_hash(values)
+        self.assertEqual(digest, kernel_settings_snapshot._snapshot_hash(dict(values)))
+        values["vm.swappiness"] = "10"
+        self.assertNotEqual(digest, kernel_settings_snapshot._snapshot_hash(values))